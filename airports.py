@@ -0,0 +1,119 @@
+from datetime import tzinfo, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+# IATA city/airport code → IANA time zone. Metropolitan city codes (BUE, LON,
+# NYC, ...) are listed alongside their main airports.
+AIRPORT_TIMEZONES = {
+    # South America
+    "BUE": "America/Argentina/Buenos_Aires",
+    "EZE": "America/Argentina/Buenos_Aires",
+    "AEP": "America/Argentina/Buenos_Aires",
+    "COR": "America/Argentina/Cordoba",
+    "MDZ": "America/Argentina/Mendoza",
+    "BRC": "America/Argentina/Salta",
+    "USH": "America/Argentina/Ushuaia",
+    "SCL": "America/Santiago",
+    "MVD": "America/Montevideo",
+    "ASU": "America/Asuncion",
+    "LIM": "America/Lima",
+    "BOG": "America/Bogota",
+    "UIO": "America/Guayaquil",
+    "CCS": "America/Caracas",
+    "SAO": "America/Sao_Paulo",
+    "GRU": "America/Sao_Paulo",
+    "GIG": "America/Sao_Paulo",
+    "RIO": "America/Sao_Paulo",
+    "BSB": "America/Sao_Paulo",
+    # North and Central America
+    "NYC": "America/New_York",
+    "JFK": "America/New_York",
+    "EWR": "America/New_York",
+    "BOS": "America/New_York",
+    "WAS": "America/New_York",
+    "IAD": "America/New_York",
+    "ATL": "America/New_York",
+    "MIA": "America/New_York",
+    "MCO": "America/New_York",
+    "YTO": "America/Toronto",
+    "YYZ": "America/Toronto",
+    "CHI": "America/Chicago",
+    "ORD": "America/Chicago",
+    "DFW": "America/Chicago",
+    "IAH": "America/Chicago",
+    "MEX": "America/Mexico_City",
+    "CUN": "America/Cancun",
+    "PTY": "America/Panama",
+    "DEN": "America/Denver",
+    "PHX": "America/Phoenix",
+    "LAX": "America/Los_Angeles",
+    "SFO": "America/Los_Angeles",
+    "SEA": "America/Los_Angeles",
+    "YVR": "America/Vancouver",
+    "HNL": "Pacific/Honolulu",
+    # Europe
+    "LON": "Europe/London",
+    "LHR": "Europe/London",
+    "LGW": "Europe/London",
+    "DUB": "Europe/Dublin",
+    "LIS": "Europe/Lisbon",
+    "MAD": "Europe/Madrid",
+    "BCN": "Europe/Madrid",
+    "PMI": "Europe/Madrid",
+    "AGP": "Europe/Madrid",
+    "PAR": "Europe/Paris",
+    "CDG": "Europe/Paris",
+    "ORY": "Europe/Paris",
+    "AMS": "Europe/Amsterdam",
+    "BRU": "Europe/Brussels",
+    "FRA": "Europe/Berlin",
+    "MUC": "Europe/Berlin",
+    "BER": "Europe/Berlin",
+    "ZRH": "Europe/Zurich",
+    "VIE": "Europe/Vienna",
+    "ROM": "Europe/Rome",
+    "FCO": "Europe/Rome",
+    "MIL": "Europe/Rome",
+    "MXP": "Europe/Rome",
+    "CPH": "Europe/Copenhagen",
+    "OSL": "Europe/Oslo",
+    "STO": "Europe/Stockholm",
+    "ARN": "Europe/Stockholm",
+    "HEL": "Europe/Helsinki",
+    "WAW": "Europe/Warsaw",
+    "PRG": "Europe/Prague",
+    "ATH": "Europe/Athens",
+    "IST": "Europe/Istanbul",
+    # Africa and Middle East
+    "CAI": "Africa/Cairo",
+    "CMN": "Africa/Casablanca",
+    "JNB": "Africa/Johannesburg",
+    "NBO": "Africa/Nairobi",
+    "DXB": "Asia/Dubai",
+    "DOH": "Asia/Qatar",
+    "TLV": "Asia/Jerusalem",
+    # Asia and Oceania
+    "DEL": "Asia/Kolkata",
+    "BOM": "Asia/Kolkata",
+    "BKK": "Asia/Bangkok",
+    "SIN": "Asia/Singapore",
+    "HKG": "Asia/Hong_Kong",
+    "PEK": "Asia/Shanghai",
+    "PVG": "Asia/Shanghai",
+    "TYO": "Asia/Tokyo",
+    "NRT": "Asia/Tokyo",
+    "HND": "Asia/Tokyo",
+    "ICN": "Asia/Seoul",
+    "SYD": "Australia/Sydney",
+    "MEL": "Australia/Melbourne",
+    "AKL": "Pacific/Auckland",
+}
+
+
+@lru_cache(maxsize=None)
+def get_airport_timezone(iata_code: str) -> tzinfo:
+    """
+    Returns the local time zone of an airport, falling back to UTC for unknown codes.
+    """
+    name = AIRPORT_TIMEZONES.get(iata_code)
+    return ZoneInfo(name) if name else timezone.utc
@@ -0,0 +1,31 @@
+from os import getenv
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_API_URL = "https://mock.apidog.com/m1/814105-793312-default/flight-events"
+
+# Upstream feed of flight events. Point it at `tools.feed_server` to run offline.
+API_URL = getenv("FLIGHT_EVENTS_API_URL", DEFAULT_API_URL)
+MAX_RETRIES = int(getenv("FLIGHT_EVENTS_MAX_RETRIES", "3"))
+TIMEOUT = float(getenv("FLIGHT_EVENTS_TIMEOUT", "5.0"))
+RETRY_DELAY = float(getenv("FLIGHT_EVENTS_RETRY_DELAY", "2.0"))
+
+# Seconds a fetched snapshot is reused before refetching; 0 refetches on every search.
+SNAPSHOT_TTL = float(getenv("FLIGHT_EVENTS_SNAPSHOT_TTL", "60"))
+# Departure day used for date queries: "utc" or "local" (departure airport time).
+DAY_BUCKETING = getenv("FLIGHT_EVENTS_DAY_BUCKETING", "utc").lower()
+if DAY_BUCKETING not in ("utc", "local"):
+    raise ValueError(
+        f"FLIGHT_EVENTS_DAY_BUCKETING must be 'utc' or 'local', got {DAY_BUCKETING!r}."
+    )
+
+# Opt-in per-request profiling (`?profile=true` or `X-Profile: 1`) and its debug endpoints.
+PROFILING_ENABLED = getenv("FLIGHT_SEARCH_PROFILING", "false").lower() in ("1", "true")
+# "auto" (pyinstrument when installed, else cProfile), "pyinstrument" or "cprofile".
+PROFILER = getenv("FLIGHT_SEARCH_PROFILER", "auto")
+PROFILE_STORE_SIZE = int(getenv("FLIGHT_SEARCH_PROFILE_STORE_SIZE", "20"))
+# Searches slower than this are written to the slow-query log.
+SLOW_QUERY_THRESHOLD_MS = float(getenv("FLIGHT_SEARCH_SLOW_QUERY_MS", "500"))
+SLOW_QUERY_LOG_SIZE = int(getenv("FLIGHT_SEARCH_SLOW_QUERY_LOG_SIZE", "100"))
@@ -1,11 +1,34 @@
-from fastapi import FastAPI, Query
-from services import search_journeys
+from contextlib import nullcontext
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import TypeAdapter
+
+from config import DAY_BUCKETING, PROFILING_ENABLED
+from models import JourneyPayload
+from profiling import (
+    RequestProfiler,
+    SearchStats,
+    StoredProfile,
+    profile_store,
+    slow_queries,
+)
+from services import get_flight_snapshot, search_journeys
+from snapshot import DayBucketing, FlightSnapshot
 
 app = FastAPI()
 
+# Serializes search candidates in the same JSON shape as a list of `Journey` models
+journey_payloads_adapter = TypeAdapter(List[JourneyPayload])
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
 
 @app.get("/journeys/search")
 async def search_flights(
+    request: Request,
     date: str = Query(..., pattern=r"^\d{4}-\d{2}-\d{2}$"),
     origin: str = Query(
         ..., alias="from", min_length=3, max_length=3, pattern=r"^[A-Z]{3}$"
@@ -13,6 +36,8 @@ async def search_flights(
     destination: str = Query(
         ..., alias="to", min_length=3, max_length=3, pattern=r"^[A-Z]{3}$"
     ),
+    day: DayBucketing = Query(DAY_BUCKETING),
+    profile: bool = Query(False),
 ):
     """
     FastAPI endpoint to search for available journeys.
@@ -21,16 +46,93 @@ async def search_flights(
         date (str): The travel date in 'YYYY-MM-DD' format.
         origin (str): The IATA code of the departure city.
         destination (str): The IATA code of the arrival city.
+        day (str): Whether `date` is a UTC day ("utc") or a local day at the departure airport ("local").
+        profile (bool): Capture a profile of this request (also `X-Profile: 1`), when profiling is enabled.
 
     Returns:
-        JSON response with available journeys.
+        JSON response with available journeys. Profiled responses carry the stored
+        profile's id in the `X-Profile-Id` header.
     """
+    profiler = None
+    if PROFILING_ENABLED and (
+        profile or request.headers.get(PROFILE_HEADER, "").lower() in ("1", "true")
+    ):
+        profiler = RequestProfiler()
+
+    snapshot = None
+    if profiler and profiler.scope == "search":
+        # Fetch before profiling so the profiled search never awaits, and cProfile
+        # cannot pick up other requests running on the event loop meanwhile
+        snapshot = await get_flight_snapshot()
+
+    with profiler or nullcontext():
+        response = await build_search_response(date, origin, destination, day, snapshot)
 
-    journeys = await search_journeys(date, origin, destination)
+    if profiler and profiler.captured:
+        stored = profile_store.add(
+            request.url.query, profiler.name, profiler.scope, profiler.report()
+        )
+        response.headers[PROFILE_ID_HEADER] = stored.id
+    return response
+
+
+async def build_search_response(
+    date: str,
+    origin: str,
+    destination: str,
+    day: DayBucketing,
+    snapshot: Optional[FlightSnapshot] = None,
+) -> Response:
+    """
+    Runs the search (on `snapshot` when given) and serializes its result.
+    """
+    journeys = await search_journeys(date, origin, destination, day, snapshot)
 
     if not journeys:
-        return {
-            "message": f"No journeys available for route {origin} → {destination} on {date}"
-        }
+        return JSONResponse(
+            {
+                "message": f"No journeys available for route {origin} → {destination} on {date}"
+            }
+        )
+
+    # Serialize the candidates' flights directly, without building `Journey` models
+    return Response(
+        content=journey_payloads_adapter.dump_json([j.to_payload() for j in journeys]),
+        media_type="application/json",
+    )
+
 
-    return journeys
+def require_profiling():
+    """Hides the debug endpoints unless profiling is enabled."""
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@app.get("/debug/profiles", response_model=List[StoredProfile])
+async def list_profiles():
+    """
+    Lists the stored request profiles, oldest first.
+    """
+    require_profiling()
+    return profile_store.list()
+
+
+@app.get("/debug/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str):
+    """
+    Returns the text report of a stored request profile.
+    """
+    require_profiling()
+    stored = profile_store.get(profile_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return stored.report
+
+
+@app.get("/debug/slow-queries", response_model=List[SearchStats])
+async def list_slow_queries():
+    """
+    Lists the most recent searches that exceeded the slow-query threshold.
+    """
+    require_profiling()
+    return list(slow_queries)
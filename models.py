@@ -1,8 +1,9 @@
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 
 from pydantic_core.core_schema import ValidationInfo
+from typing_extensions import TypedDict
 
 
 class FlightEvent(BaseModel):
@@ -54,3 +55,35 @@ class Journey(BaseModel):
             }
         }
     )
+
+
+class JourneyPayload(TypedDict):
+    """Serialization-only shape of a `Journey`, built without a model instance."""
+
+    connections: int
+    path: Tuple[FlightEvent, ...]
+
+
+class JourneyCandidate:
+    """
+    Lightweight journey used during search. It holds references to already
+    validated flights and is serialized straight from them when responding;
+    `to_journey()` is for callers that need the `Journey` model itself.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, *path: FlightEvent):
+        self.path: Tuple[FlightEvent, ...] = path
+
+    @property
+    def connections(self) -> int:
+        return len(self.path) - 1
+
+    def to_payload(self) -> JourneyPayload:
+        """Returns the journey in the shape `Journey` serializes to."""
+        return {"connections": len(self.path) - 1, "path": self.path}
+
+    def to_journey(self) -> Journey:
+        """Builds the `Journey` model; its flights are already validated instances."""
+        return Journey(connections=self.connections, path=list(self.path))
@@ -0,0 +1,188 @@
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from cProfile import Profile
+from datetime import datetime, timezone
+from io import StringIO
+from logging import getLogger
+from pstats import Stats
+from threading import Lock
+from time import perf_counter
+from typing import Deque, Dict, List, Optional
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from config import (
+    PROFILER,
+    PROFILE_STORE_SIZE,
+    SLOW_QUERY_THRESHOLD_MS,
+    SLOW_QUERY_LOG_SIZE,
+)
+
+logger = getLogger(__name__)
+slow_query_logger = getLogger("slow_queries")
+
+PROFILE_TOP_FUNCTIONS = 40
+
+# Held while a request is being profiled; only one profiler can hook the interpreter
+_active_profiler = Lock()
+
+
+class SearchStats(BaseModel):
+    date: str = Field(..., description="Requested travel date")
+    origin: str = Field(..., description="IATA code of the departure city")
+    destination: str = Field(..., description="IATA code of the arrival city")
+    day_bucketing: str = Field(..., description="Day bucketing used for the date")
+    flights_after_date_filter: int = Field(0, description="Flights on the date range")
+    origin_fanout: int = Field(0, description="Flights departing from the origin")
+    second_legs_scanned: int = Field(
+        0, description="Second legs scanned by the connecting-flight search"
+    )
+    second_leg_candidates: int = Field(
+        0, description="Scanned second legs reaching the destination"
+    )
+    direct_journeys: int = Field(0, description="Direct journeys found")
+    connecting_journeys: int = Field(0, description="Connecting journeys found")
+    timings_ms: Dict[str, float] = Field(
+        default_factory=dict, description="Duration of each search stage"
+    )
+
+    @contextmanager
+    def timed(self, stage: str):
+        """Records the wall-clock duration of a search stage."""
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings_ms[stage] = (perf_counter() - started) * 1000
+
+
+class StoredProfile(BaseModel):
+    id: str = Field(..., description="Profile identifier")
+    query: str = Field(..., description="Query string of the profiled request")
+    created_at: datetime = Field(..., description="UTC capture time")
+    profiler: str = Field(..., description="Profiler that produced the report")
+    scope: str = Field(
+        ...,
+        description="'request' (whole request, fetch included) or 'search' (search "
+        "and serialization after the snapshot was fetched)",
+    )
+    report: str = Field(..., description="Text report of the profile")
+
+
+class ProfileStore:
+    """
+    Keeps the most recent request profiles in memory, evicting the oldest first.
+    """
+
+    def __init__(self, max_size: int = PROFILE_STORE_SIZE):
+        self.max_size = max_size
+        self.profiles: "OrderedDict[str, StoredProfile]" = OrderedDict()
+
+    def add(self, query: str, profiler: str, scope: str, report: str) -> StoredProfile:
+        profile = StoredProfile(
+            id=uuid4().hex,
+            query=query,
+            created_at=datetime.now(timezone.utc),
+            profiler=profiler,
+            scope=scope,
+            report=report,
+        )
+        self.profiles[profile.id] = profile
+        while len(self.profiles) > self.max_size:
+            self.profiles.popitem(last=False)
+        return profile
+
+    def get(self, profile_id: str) -> Optional[StoredProfile]:
+        return self.profiles.get(profile_id)
+
+    def list(self) -> List[StoredProfile]:
+        return list(self.profiles.values())
+
+
+class RequestProfiler:
+    """
+    Profiles a block of code with pyinstrument or cProfile.
+
+    pyinstrument's async mode attributes awaited time to the profiled coroutine
+    only, so it can cover the whole request. cProfile traces everything running on
+    the thread, so other requests scheduled during an await would show up in its
+    report: it must only wrap code that does not yield to the event loop.
+    """
+
+    def __init__(self, profiler: Optional[str] = None):
+        profiler = profiler or PROFILER
+        self.name = "cprofile"
+        self.profiler = None
+        if profiler in ("auto", "pyinstrument"):
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                if profiler == "pyinstrument":
+                    logger.warning("pyinstrument is not installed; using cProfile.")
+            else:
+                self.name = "pyinstrument"
+                self.profiler = Profiler(async_mode="enabled")
+        if self.profiler is None:
+            self.profiler = Profile()
+        self.captured = False
+
+    @property
+    def scope(self) -> str:
+        """
+        What the profile should cover: the whole "request" for pyinstrument, or
+        only the "search" after the snapshot is fetched for cProfile.
+        """
+        return "request" if self.name == "pyinstrument" else "search"
+
+    def __enter__(self) -> "RequestProfiler":
+        # Concurrent requests go unprofiled rather than stealing the hook
+        if not _active_profiler.acquire(blocking=False):
+            logger.warning("Request not profiled: another profile is in progress.")
+            return self
+        try:
+            if self.name == "pyinstrument":
+                self.profiler.start()
+            else:
+                self.profiler.enable()
+        except (RuntimeError, ValueError) as e:
+            _active_profiler.release()
+            logger.warning(f"Request not profiled: {e}")
+        else:
+            self.captured = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self.captured:
+            return
+        try:
+            if self.name == "pyinstrument":
+                self.profiler.stop()
+            else:
+                self.profiler.disable()
+        finally:
+            _active_profiler.release()
+
+    def report(self) -> str:
+        """Returns a text report, sorted by cumulative time for cProfile."""
+        if self.name == "pyinstrument":
+            return self.profiler.output_text()
+        output = StringIO()
+        Stats(self.profiler, stream=output).sort_stats("cumulative").print_stats(
+            PROFILE_TOP_FUNCTIONS
+        )
+        return output.getvalue()
+
+
+profile_store = ProfileStore()
+slow_queries: Deque[SearchStats] = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+
+
+def log_slow_query(stats: SearchStats):
+    """
+    Records a search in the slow-query log when its total time exceeds the threshold.
+    """
+    if stats.timings_ms.get("total", 0.0) < SLOW_QUERY_THRESHOLD_MS:
+        return
+    slow_queries.append(stats)
+    slow_query_logger.warning(f"Slow search: {stats.model_dump_json()}")
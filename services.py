@@ -1,19 +1,28 @@
 from httpx import AsyncClient, RequestError
-from asyncio import sleep
+from asyncio import Task, create_task, shield, sleep
 from logging import getLogger, basicConfig, INFO
 
+from config import (
+    API_URL,
+    MAX_RETRIES,
+    TIMEOUT,
+    RETRY_DELAY,
+    SNAPSHOT_TTL,
+    DAY_BUCKETING,
+)
 from exceptions import FlightDataFetchError
 from datetime import datetime, timedelta
-from typing import List, Dict
-from models import FlightEvent, Journey
+from typing import List, Dict, Optional
+from models import FlightEvent, JourneyCandidate
+from profiling import SearchStats, log_slow_query
+from snapshot import DayBucketing, FlightSnapshot
 
 
 basicConfig(level=INFO)
 logger = getLogger(__name__)
 
-API_URL = "https://mock.apidog.com/m1/814105-793312-default/flight-events"
-MAX_RETRIES = 3
-TIMEOUT = 5.0
+_snapshot: Optional[FlightSnapshot] = None
+_snapshot_refresh: Optional[Task] = None
 
 
 async def fetch_flight_events() -> List[FlightEvent]:
@@ -42,13 +51,58 @@ async def fetch_flight_events() -> List[FlightEvent]:
         except RequestError as e:
             logger.info(f"Attempt {attempt}: Failed to connect to API: {e}")
 
-        await sleep(2)
+        await sleep(RETRY_DELAY)
 
     logger.error("Failed to fetch data from API after multiple attempts.")
     raise FlightDataFetchError()
 
 
-async def search_journeys(date: str, origin: str, destination: str) -> List[Journey]:
+async def get_flight_snapshot() -> FlightSnapshot:
+    """
+    Returns the current flight snapshot, fetching and bucketing a new one when the
+    cached snapshot is older than SNAPSHOT_TTL seconds.
+
+    Searches that find the snapshot stale while a refresh is in flight await that
+    same refresh, so its result or its failure reaches all of them at once. With
+    SNAPSHOT_TTL <= 0 every search fetches its own snapshot, concurrently.
+    """
+    global _snapshot_refresh
+    if SNAPSHOT_TTL <= 0:
+        return FlightSnapshot(await fetch_flight_events())
+    if not is_snapshot_stale():
+        return _snapshot
+    if _snapshot_refresh is None:
+        _snapshot_refresh = create_task(refresh_flight_snapshot())
+    # Shielded so a cancelled search does not cancel the refresh for the others
+    return await shield(_snapshot_refresh)
+
+
+async def refresh_flight_snapshot() -> FlightSnapshot:
+    """
+    Fetches and buckets a new snapshot, replacing the cached one.
+    """
+    global _snapshot, _snapshot_refresh
+    try:
+        _snapshot = FlightSnapshot(await fetch_flight_events())
+        return _snapshot
+    finally:
+        _snapshot_refresh = None
+
+
+def is_snapshot_stale() -> bool:
+    """
+    Whether the cached snapshot is missing or older than SNAPSHOT_TTL seconds.
+    """
+    return _snapshot is None or _snapshot.age >= SNAPSHOT_TTL
+
+
+async def search_journeys(
+    date: str,
+    origin: str,
+    destination: str,
+    day_bucketing: DayBucketing = DAY_BUCKETING,
+    snapshot: Optional[FlightSnapshot] = None,
+) -> List[JourneyCandidate]:
     """
     Searches for valid journeys (direct or with one connection) from an origin to a destination.
 
@@ -56,34 +110,71 @@ async def search_journeys(date: str, origin: str, destination: str) -> List[Jour
         date (str): The travel date in 'YYYY-MM-DD' format.
         origin (str): The IATA code of the departure city.
         destination (str): The IATA code of the arrival city.
+        day_bucketing (str): Whether `date` is a UTC day ("utc") or a day in the
+            departure airport's local time ("local").
+        snapshot (FlightSnapshot, optional): An already fetched snapshot to search;
+            the current one is fetched when omitted.
 
     Returns:
-        List[Journey]: A list of valid journeys matching the criteria.
+        List[JourneyCandidate]: A list of valid journeys matching the criteria,
+            to be materialized with `to_journey()` at the response boundary.
     """
-    all_flights = await fetch_flight_events()
-    search_date = datetime.strptime(date, "%Y-%m-%d")
+    stats = SearchStats(
+        date=date, origin=origin, destination=destination, day_bucketing=day_bucketing
+    )
+    with stats.timed("total"):
+        journeys = await find_journeys(
+            date, origin, destination, day_bucketing, stats, snapshot
+        )
+    log_slow_query(stats)
+    return journeys
+
+
+async def find_journeys(
+    date: str,
+    origin: str,
+    destination: str,
+    day_bucketing: DayBucketing,
+    stats: SearchStats,
+    snapshot: Optional[FlightSnapshot] = None,
+) -> List[JourneyCandidate]:
+    """
+    Runs the search stages for `search_journeys`, recording candidate counts and
+    stage timings in `stats`.
+    """
+    if snapshot is None:
+        with stats.timed("snapshot"):
+            snapshot = await get_flight_snapshot()
+    search_date = datetime.strptime(date, "%Y-%m-%d").date()
 
-    # Filter flights that operate on the requested date range
-    flights = filter_flights_by_date(all_flights, search_date)
+    # Look up the partitions for the requested date range
+    with stats.timed("date_filter"):
+        flights = snapshot.flights_for_date(search_date, day_bucketing)
+    stats.flights_after_date_filter = len(flights)
 
     # Build indexes for efficient lookups
-    flights_by_departure = build_flights_index_by_departure(flights)
+    with stats.timed("index"):
+        flights_by_departure = build_flights_index_by_departure(flights)
+    flights_from_origin = flights_by_departure.get(origin, [])
+    stats.origin_fanout = len(flights_from_origin)
 
     # Early exit if there are no flights departing from origin or arriving at destination
     if origin not in flights_by_departure:
         logger.warning(f"No available flights departing from '{origin}'.")
         return []
-    if destination not in [f.arrival_city for f in flights]:
+    if not any(f.arrival_city == destination for f in flights):
         logger.warning(f"No available flights arriving at '{destination}'.")
         return []
 
     # Retrieve direct and connecting journeys using the indexes
-    direct_flights = get_direct_flights(
-        flights_by_departure.get(origin, []), destination
-    )
-    connecting_flights = get_connecting_flights(
-        flights_by_departure, origin, destination
-    )
+    with stats.timed("direct"):
+        direct_flights = get_direct_flights(flights_from_origin, destination)
+    with stats.timed("connecting"):
+        connecting_flights = get_connecting_flights(
+            flights_by_departure, origin, destination, stats
+        )
+    stats.direct_journeys = len(direct_flights)
+    stats.connecting_journeys = len(connecting_flights)
 
     valid_journeys = direct_flights + connecting_flights
     if not valid_journeys:
@@ -93,20 +184,6 @@ async def search_journeys(date: str, origin: str, destination: str) -> List[Jour
     return valid_journeys
 
 
-def filter_flights_by_date(
-    flights: List[FlightEvent], search_date: datetime
-) -> List[FlightEvent]:
-    """
-    Filters flights that operate on the requested date (from midnight of search_date to before midnight the next day).
-    """
-    next_date = search_date + timedelta(days=1)
-    return [
-        flight
-        for flight in flights
-        if search_date.date() <= flight.departure_datetime.date() <= next_date.date()
-    ]
-
-
 def build_flights_index_by_departure(
     flights: List[FlightEvent],
 ) -> Dict[str, List[FlightEvent]]:
@@ -121,7 +198,7 @@ def build_flights_index_by_departure(
 
 def get_direct_flights(
     flights_from_origin: List[FlightEvent], destination: str
-) -> List[Journey]:
+) -> List[JourneyCandidate]:
     """
     Extracts direct flights (without connection) from the given list of flights departing from the origin.
     """
@@ -132,23 +209,32 @@ def get_direct_flights(
             if (flight.arrival_datetime - flight.departure_datetime) <= timedelta(
                 hours=24
             ):
-                direct_journeys.append(Journey(connections=0, path=[flight]))
+                direct_journeys.append(JourneyCandidate(flight))
     return direct_journeys
 
 
 def get_connecting_flights(
-    flights_by_departure: Dict[str, List[FlightEvent]], origin: str, destination: str
-) -> List[Journey]:
+    flights_by_departure: Dict[str, List[FlightEvent]],
+    origin: str,
+    destination: str,
+    stats: Optional[SearchStats] = None,
+) -> List[JourneyCandidate]:
     """
     Extracts connecting flights (with one stop) that depart from the origin and arrive at the destination.
-    Uses the departure index for efficient lookup.
+    Uses the departure index for efficient lookup. When `stats` is given, records how
+    many second legs were scanned and how many reached the destination.
     """
     connecting_journeys = []
+    second_legs_scanned = 0
+    second_leg_candidates = 0
     # Iterate over flights departing from the origin
     for flight1 in flights_by_departure.get(origin, []):
         # For a valid connection, look up flights departing from flight1's arrival city
-        for flight2 in flights_by_departure.get(flight1.arrival_city, []):
+        second_legs = flights_by_departure.get(flight1.arrival_city, [])
+        second_legs_scanned += len(second_legs)
+        for flight2 in second_legs:
             if flight2.arrival_city == destination:
+                second_leg_candidates += 1
                 layover = flight2.departure_datetime - flight1.arrival_datetime
                 total_journey_time = (
                     flight2.arrival_datetime - flight1.departure_datetime
@@ -156,7 +242,8 @@ def get_connecting_flights(
                 if timedelta(hours=0) <= layover <= timedelta(
                     hours=4
                 ) and total_journey_time <= timedelta(hours=24):
-                    connecting_journeys.append(
-                        Journey(connections=1, path=[flight1, flight2])
-                    )
+                    connecting_journeys.append(JourneyCandidate(flight1, flight2))
+    if stats is not None:
+        stats.second_legs_scanned = second_legs_scanned
+        stats.second_leg_candidates = second_leg_candidates
     return connecting_journeys
@@ -0,0 +1,59 @@
+from datetime import date, datetime, timedelta, timezone
+from time import monotonic
+from typing import Dict, List, Literal
+
+from airports import get_airport_timezone
+from models import FlightEvent
+
+DayBucketing = Literal["utc", "local"]
+
+
+def as_utc(moment: datetime) -> datetime:
+    """
+    Normalizes a datetime to UTC, treating naive values as already being UTC.
+    """
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+class FlightSnapshot:
+    """
+    A fetched set of flight events, partitioned by departure day.
+
+    Departure days are computed once, at ingestion, both in UTC and in the local
+    time of the departure airport, so a date query is a dictionary lookup.
+    """
+
+    def __init__(self, flights: List[FlightEvent]):
+        self.flights = flights
+        self.created_at = monotonic()
+        self.partitions: Dict[DayBucketing, Dict[date, List[FlightEvent]]] = {
+            "utc": {},
+            "local": {},
+        }
+
+        for flight in flights:
+            departure = as_utc(flight.departure_datetime)
+            local_departure = departure.astimezone(
+                get_airport_timezone(flight.departure_city)
+            )
+            self.partitions["utc"].setdefault(departure.date(), []).append(flight)
+            self.partitions["local"].setdefault(local_departure.date(), []).append(
+                flight
+            )
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since the snapshot was built."""
+        return monotonic() - self.created_at
+
+    def flights_for_date(
+        self, search_date: date, day_bucketing: DayBucketing = "utc"
+    ) -> List[FlightEvent]:
+        """
+        Returns flights departing on the requested date or the following day.
+        """
+        partitions = self.partitions[day_bucketing]
+        next_date = search_date + timedelta(days=1)
+        return partitions.get(search_date, []) + partitions.get(next_date, [])
@@ -0,0 +1,10 @@
+import pytest
+
+import services
+
+
+@pytest.fixture(autouse=True)
+def reset_flight_snapshot(monkeypatch):
+    """Ensures every test fetches its own (usually mocked) flight snapshot."""
+    monkeypatch.setattr(services, "_snapshot", None)
+    monkeypatch.setattr(services, "_snapshot_refresh", None)
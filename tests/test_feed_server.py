@@ -0,0 +1,74 @@
+import json
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from models import FlightEvent
+from tools.feed_server import FeedSettings, create_app, generate_flight_events
+
+START_DATE = date(2024, 9, 12)
+
+
+def test_generate_flight_events_is_deterministic():
+    first = generate_flight_events(50, START_DATE, seed=7)
+    second = generate_flight_events(50, START_DATE, seed=7)
+
+    assert first == second
+    assert len(first) == 50
+    for event in first:
+        flight = FlightEvent(**event)
+        assert flight.departure_city != flight.arrival_city
+        assert flight.departure_datetime.date() >= START_DATE
+
+
+def test_feed_serves_synthetic_events():
+    client = TestClient(create_app(FeedSettings(size=20, start_date=START_DATE)))
+
+    response = client.get("/flight-events")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 20
+
+
+def test_feed_size_override():
+    client = TestClient(create_app(FeedSettings(size=20, start_date=START_DATE)))
+
+    response = client.get("/flight-events", params={"size": 5})
+
+    assert len(response.json()) == 5
+
+
+def test_feed_size_override_grows_synthetic_feed():
+    client = TestClient(create_app(FeedSettings(size=20, start_date=START_DATE)))
+
+    small = client.get("/flight-events").json()
+    large = client.get("/flight-events", params={"size": 50}).json()
+
+    assert len(large) == 50
+    assert large[:20] == small
+
+
+def test_feed_injected_errors():
+    client = TestClient(create_app(FeedSettings(error_rate=1.0, error_status=503)))
+
+    response = client.get("/flight-events")
+
+    assert response.status_code == 503
+    assert client.get("/flight-events", params={"error_rate": 0}).status_code == 200
+
+
+def test_feed_serves_recorded_events(tmp_path):
+    recorded = generate_flight_events(3, START_DATE)
+    source = tmp_path / "recorded.json"
+    source.write_text(json.dumps(recorded))
+    client = TestClient(create_app(FeedSettings(source=str(source))))
+
+    assert client.get("/flight-events").json() == recorded
+
+
+def test_feed_size_override_cannot_grow_recorded_events(tmp_path):
+    source = tmp_path / "recorded.json"
+    source.write_text(json.dumps(generate_flight_events(3, START_DATE)))
+    client = TestClient(create_app(FeedSettings(source=str(source))))
+
+    assert len(client.get("/flight-events", params={"size": 10}).json()) == 3
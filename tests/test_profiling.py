@@ -0,0 +1,213 @@
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
+
+import profiling
+from main import app
+from models import FlightEvent
+from profiling import ProfileStore, RequestProfiler
+from services import search_journeys
+
+now = datetime.now()
+DATE = (now + timedelta(days=2)).strftime("%Y-%m-%d")
+
+MOCK_FLIGHTS = [
+    FlightEvent(
+        flight_number="XX1234",
+        departure_city="BUE",
+        arrival_city="MAD",
+        departure_datetime=(now + timedelta(days=2, hours=12)).isoformat() + "Z",
+        arrival_datetime=(now + timedelta(days=2, hours=24)).isoformat() + "Z",
+    ),
+    FlightEvent(
+        flight_number="XX2345",
+        departure_city="MAD",
+        arrival_city="PMI",
+        departure_datetime=(now + timedelta(days=3, hours=2)).isoformat() + "Z",
+        arrival_datetime=(now + timedelta(days=3, hours=3)).isoformat() + "Z",
+    ),
+    FlightEvent(
+        flight_number="XX3456",
+        departure_city="BUE",
+        arrival_city="PMI",
+        departure_datetime=(now + timedelta(days=2, hours=14)).isoformat() + "Z",
+        arrival_datetime=(now + timedelta(days=2, hours=20)).isoformat() + "Z",
+    ),
+]
+
+
+@pytest.fixture
+def client():
+    """Provides a FastAPI test client."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def profiling_enabled(monkeypatch):
+    monkeypatch.setattr("main.PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiling, "PROFILER", "cprofile")
+    monkeypatch.setattr("main.profile_store", ProfileStore())
+
+
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+def test_profile_query_flag(mock_fetch_flight_events, client, profiling_enabled):
+    mock_fetch_flight_events.return_value = MOCK_FLIGHTS
+
+    response = client.get(
+        "/journeys/search",
+        params={"date": DATE, "from": "BUE", "to": "PMI", "profile": "true"},
+    )
+
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+    report = client.get(f"/debug/profiles/{profile_id}")
+    assert report.status_code == 200
+    assert "search_journeys" in report.text
+    # cProfile only covers the search, after the snapshot was fetched
+    assert "get_flight_snapshot" not in report.text
+    stored = client.get("/debug/profiles").json()
+    assert [(p["id"], p["profiler"], p["scope"]) for p in stored] == [
+        (profile_id, "cprofile", "search")
+    ]
+
+
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+def test_profile_header(mock_fetch_flight_events, client, profiling_enabled):
+    mock_fetch_flight_events.return_value = MOCK_FLIGHTS
+
+    response = client.get(
+        "/journeys/search",
+        params={"date": DATE, "from": "BUE", "to": "SFO"},
+        headers={"X-Profile": "1"},
+    )
+
+    assert response.json()["message"].startswith("No journeys available")
+    assert "X-Profile-Id" in response.headers
+
+
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+def test_profiling_disabled_by_default(mock_fetch_flight_events, client):
+    mock_fetch_flight_events.return_value = MOCK_FLIGHTS
+
+    response = client.get(
+        "/journeys/search",
+        params={"date": DATE, "from": "BUE", "to": "PMI", "profile": "true"},
+    )
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+    assert client.get("/debug/profiles").status_code == 404
+    assert client.get("/debug/slow-queries").status_code == 404
+
+
+def test_nested_profilers_capture_only_the_first():
+    with RequestProfiler("cprofile") as first:
+        with RequestProfiler("cprofile") as second:
+            sum(range(1000))
+
+    assert first.captured is True
+    assert second.captured is False
+    assert "sum" in first.report()
+
+    with RequestProfiler("cprofile") as third:
+        pass
+    assert third.captured is True
+
+
+def test_auto_profiler_prefers_pyinstrument(monkeypatch):
+    class FakeProfiler:
+        def __init__(self, async_mode):
+            self.async_mode = async_mode
+
+    monkeypatch.setitem(
+        sys.modules, "pyinstrument", SimpleNamespace(Profiler=FakeProfiler)
+    )
+
+    profiler = RequestProfiler("auto")
+
+    assert profiler.name == "pyinstrument"
+    assert profiler.scope == "request"
+    assert profiler.profiler.async_mode == "enabled"
+
+
+def test_auto_profiler_falls_back_to_cprofile(monkeypatch, caplog):
+    monkeypatch.setitem(sys.modules, "pyinstrument", None)
+
+    profiler = RequestProfiler("auto")
+
+    assert profiler.name == "cprofile"
+    assert profiler.scope == "search"
+    assert "not installed" not in caplog.text
+
+
+def test_profile_store_evicts_oldest():
+    store = ProfileStore(max_size=2)
+
+    first = store.add("a", "cprofile", "search", "report a")
+    second = store.add("b", "cprofile", "search", "report b")
+    third = store.add("c", "cprofile", "search", "report c")
+
+    assert store.get(first.id) is None
+    assert store.list() == [second, third]
+
+
+@pytest.mark.asyncio
+@patch("profiling.SLOW_QUERY_THRESHOLD_MS", 0)
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_slow_query_log_records_stage_counts(mock_fetch_flight_events, caplog):
+    mock_fetch_flight_events.return_value = MOCK_FLIGHTS
+    profiling.slow_queries.clear()
+
+    await search_journeys(DATE, "BUE", "PMI")
+
+    stats = profiling.slow_queries[-1]
+    assert (stats.origin, stats.destination, stats.date) == ("BUE", "PMI", DATE)
+    assert stats.flights_after_date_filter == 3
+    assert stats.origin_fanout == 2
+    assert stats.second_legs_scanned == 1
+    assert stats.second_leg_candidates == 1
+    assert stats.direct_journeys == 1
+    assert stats.connecting_journeys == 1
+    assert {"total", "snapshot", "date_filter", "direct", "connecting"} <= set(
+        stats.timings_ms
+    )
+    assert "Slow search" in caplog.text
+
+
+@pytest.mark.asyncio
+@patch("profiling.SLOW_QUERY_THRESHOLD_MS", 0)
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_slow_query_counts_match_connecting_loop(mock_fetch_flight_events):
+    off_route_leg = FlightEvent(
+        flight_number="XX4567",
+        departure_city="MAD",
+        arrival_city="BCN",
+        departure_datetime=(now + timedelta(days=3, hours=2)).isoformat() + "Z",
+        arrival_datetime=(now + timedelta(days=3, hours=3)).isoformat() + "Z",
+    )
+    mock_fetch_flight_events.return_value = MOCK_FLIGHTS + [off_route_leg]
+    profiling.slow_queries.clear()
+
+    await search_journeys(DATE, "BUE", "PMI")
+    await search_journeys(DATE, "XYZ", "PMI")
+
+    routed, unknown_origin = profiling.slow_queries
+    assert routed.second_legs_scanned == 2
+    assert routed.second_leg_candidates == 1
+    assert unknown_origin.second_legs_scanned == 0
+    assert unknown_origin.second_leg_candidates == 0
+
+
+@pytest.mark.asyncio
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_fast_queries_are_not_logged(mock_fetch_flight_events):
+    mock_fetch_flight_events.return_value = MOCK_FLIGHTS
+    profiling.slow_queries.clear()
+
+    await search_journeys(DATE, "BUE", "PMI")
+
+    assert len(profiling.slow_queries) == 0
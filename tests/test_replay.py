@@ -0,0 +1,70 @@
+import json
+from argparse import ArgumentTypeError
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import ASGITransport
+from unittest.mock import AsyncMock, patch
+
+from main import app
+from tools.replay import load_queries, percentile, positive_float, positive_int, replay
+
+
+def test_load_queries_resolves_days_ahead(tmp_path):
+    log = tmp_path / "traffic.jsonl"
+    log.write_text(
+        json.dumps({"date": "2024-09-12", "from": "BUE", "to": "MAD"})
+        + "\n\n"
+        + json.dumps({"days_ahead": 2, "from": "BUE", "to": "PMI"})
+        + "\n"
+    )
+    expected_date = (datetime.now(timezone.utc).date() + timedelta(days=2)).isoformat()
+
+    queries = load_queries(str(log))
+
+    assert queries == [
+        {"date": "2024-09-12", "from": "BUE", "to": "MAD"},
+        {"date": expected_date, "from": "BUE", "to": "PMI"},
+    ]
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.asyncio
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_replay_in_process(mock_fetch_flight_events):
+    mock_fetch_flight_events.return_value = []
+    queries = [{"date": "2024-09-12", "from": "BUE", "to": "MAD"}] * 4
+
+    report = await replay(
+        queries, "http://service", qps=200, transport=ASGITransport(app=app)
+    )
+
+    assert report.requests == 4
+    assert report.status_counts == {"200": 4}
+    assert report.latency_ms["p50"] <= report.latency_ms["max"]
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "nan"])
+def test_positive_float_rejects_non_positive_rates(value):
+    with pytest.raises(ArgumentTypeError):
+        positive_float(value)
+
+
+def test_positive_int_rejects_zero_repeats():
+    assert positive_int("3") == 3
+    with pytest.raises(ArgumentTypeError):
+        positive_int("0")
+
+
+@pytest.mark.asyncio
+async def test_replay_rejects_non_positive_qps():
+    with pytest.raises(ValueError, match="qps must be positive"):
+        await replay([], "http://service", qps=0)
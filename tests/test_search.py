@@ -1,7 +1,10 @@
 import pytest
 from datetime import datetime, timedelta
+from typing import List
+from pydantic import TypeAdapter
+from main import journey_payloads_adapter
 from services import search_journeys
-from models import FlightEvent
+from models import FlightEvent, Journey, JourneyCandidate
 from unittest.mock import AsyncMock, patch
 
 
@@ -135,3 +138,30 @@ async def test_search_journeys_no_valid_routes(mock_fetch_flight_events):
     journeys = await search_journeys(date, "BE", "CN")
 
     assert journeys == []
+
+
+def test_journey_candidate_to_journey():
+    """Test that search candidates materialize into equivalent Journey models."""
+    candidate = JourneyCandidate(MOCK_FLIGHTS[0], MOCK_FLIGHTS[1])
+
+    journey = candidate.to_journey()
+
+    assert candidate.connections == 1
+    assert isinstance(journey, Journey)
+    assert journey == Journey(connections=1, path=MOCK_FLIGHTS[:2])
+
+
+def test_journey_candidate_payload_matches_journey_json():
+    """Test that candidates serialize exactly like the equivalent Journey models."""
+    candidates = [
+        JourneyCandidate(MOCK_FLIGHTS[0]),
+        JourneyCandidate(MOCK_FLIGHTS[0], MOCK_FLIGHTS[1]),
+    ]
+
+    payload_json = journey_payloads_adapter.dump_json(
+        [c.to_payload() for c in candidates]
+    )
+
+    assert payload_json == TypeAdapter(List[Journey]).dump_json(
+        [c.to_journey() for c in candidates]
+    )
@@ -0,0 +1,193 @@
+from asyncio import gather, sleep
+from datetime import date, datetime, timezone
+from time import perf_counter
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
+
+from airports import get_airport_timezone
+from exceptions import FlightDataFetchError
+from main import app
+from models import FlightEvent
+from services import get_flight_snapshot, search_journeys
+from snapshot import FlightSnapshot
+
+# 01:30 UTC on the 13th is still the evening of the 12th in Buenos Aires (UTC-3).
+LATE_BUE_DEPARTURE = FlightEvent(
+    flight_number="XX1234",
+    departure_city="BUE",
+    arrival_city="MAD",
+    departure_datetime="2024-09-13T01:30:00Z",
+    arrival_datetime="2024-09-13T13:30:00Z",
+)
+# 23:30 UTC on the 12th is already the 13th in Madrid (UTC+2).
+LATE_MAD_DEPARTURE = FlightEvent(
+    flight_number="XX2345",
+    departure_city="MAD",
+    arrival_city="PMI",
+    departure_datetime="2024-09-12T23:30:00Z",
+    arrival_datetime="2024-09-13T00:30:00Z",
+)
+FLIGHTS = [LATE_BUE_DEPARTURE, LATE_MAD_DEPARTURE]
+
+
+def test_get_airport_timezone_falls_back_to_utc():
+    assert str(get_airport_timezone("BUE")) == "America/Argentina/Buenos_Aires"
+    assert get_airport_timezone("XYZ") == timezone.utc
+
+
+def test_snapshot_partitions_by_utc_and_local_day():
+    snapshot = FlightSnapshot(FLIGHTS)
+
+    assert snapshot.partitions["utc"] == {
+        date(2024, 9, 12): [LATE_MAD_DEPARTURE],
+        date(2024, 9, 13): [LATE_BUE_DEPARTURE],
+    }
+    assert snapshot.partitions["local"] == {
+        date(2024, 9, 12): [LATE_BUE_DEPARTURE],
+        date(2024, 9, 13): [LATE_MAD_DEPARTURE],
+    }
+
+
+def test_snapshot_normalizes_offsets_to_utc():
+    flight = FlightEvent(
+        flight_number="XX3456",
+        departure_city="BUE",
+        arrival_city="MAD",
+        departure_datetime="2024-09-12T22:30:00-03:00",
+        arrival_datetime=datetime(2024, 9, 13, 13, 30, tzinfo=timezone.utc),
+    )
+
+    snapshot = FlightSnapshot([flight])
+
+    assert snapshot.flights_for_date(date(2024, 9, 13), "utc") == [flight]
+    assert snapshot.flights_for_date(date(2024, 9, 13), "local") == []
+
+
+def test_flights_for_date_includes_next_day():
+    snapshot = FlightSnapshot(FLIGHTS)
+
+    assert snapshot.flights_for_date(date(2024, 9, 12)) == [
+        LATE_MAD_DEPARTURE,
+        LATE_BUE_DEPARTURE,
+    ]
+    assert snapshot.flights_for_date(date(2024, 9, 13)) == [LATE_BUE_DEPARTURE]
+    assert snapshot.flights_for_date(date(2024, 9, 14)) == []
+
+
+@pytest.mark.asyncio
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_snapshot_is_reused_within_ttl(mock_fetch_flight_events):
+    mock_fetch_flight_events.return_value = FLIGHTS
+
+    first = await get_flight_snapshot()
+    second = await get_flight_snapshot()
+
+    assert first is second
+    mock_fetch_flight_events.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("services.SNAPSHOT_TTL", 0)
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_snapshot_is_refetched_when_ttl_disabled(mock_fetch_flight_events):
+    mock_fetch_flight_events.return_value = FLIGHTS
+
+    await get_flight_snapshot()
+    await get_flight_snapshot()
+
+    assert mock_fetch_flight_events.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_expired_snapshot_is_refreshed_once(mock_fetch_flight_events):
+    async def slow_fetch():
+        await sleep(0.01)
+        return FLIGHTS
+
+    mock_fetch_flight_events.side_effect = slow_fetch
+    stale = FlightSnapshot([])
+    stale.created_at -= 3600
+
+    with patch("services._snapshot", stale):
+        snapshots = await gather(*(get_flight_snapshot() for _ in range(5)))
+
+    mock_fetch_flight_events.assert_called_once()
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert snapshots[0].flights == FLIGHTS
+
+
+@pytest.mark.asyncio
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_failed_refresh_reaches_all_waiters_once(mock_fetch_flight_events):
+    async def failing_fetch():
+        await sleep(0.05)
+        raise FlightDataFetchError()
+
+    mock_fetch_flight_events.side_effect = failing_fetch
+
+    started = perf_counter()
+    results = await gather(
+        *(get_flight_snapshot() for _ in range(5)), return_exceptions=True
+    )
+    elapsed = perf_counter() - started
+
+    mock_fetch_flight_events.assert_called_once()
+    assert all(isinstance(result, FlightDataFetchError) for result in results)
+    assert elapsed < 0.1
+
+    # The failed refresh is not cached; the next search tries again
+    mock_fetch_flight_events.side_effect = None
+    mock_fetch_flight_events.return_value = FLIGHTS
+    assert (await get_flight_snapshot()).flights == FLIGHTS
+
+
+@pytest.mark.asyncio
+@patch("services.SNAPSHOT_TTL", 0)
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_snapshot_fetches_run_concurrently_when_ttl_disabled(
+    mock_fetch_flight_events,
+):
+    async def slow_fetch():
+        await sleep(0.05)
+        return FLIGHTS
+
+    mock_fetch_flight_events.side_effect = slow_fetch
+
+    started = perf_counter()
+    await gather(*(get_flight_snapshot() for _ in range(5)))
+    elapsed = perf_counter() - started
+
+    assert mock_fetch_flight_events.call_count == 5
+    assert elapsed < 0.1
+
+
+@pytest.mark.asyncio
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+async def test_search_journeys_local_day(mock_fetch_flight_events):
+    mock_fetch_flight_events.return_value = FLIGHTS
+
+    utc_journeys = await search_journeys("2024-09-13", "BUE", "MAD", "utc")
+    local_journeys = await search_journeys("2024-09-13", "BUE", "MAD", "local")
+
+    assert [j.path[0].flight_number for j in utc_journeys] == ["XX1234"]
+    assert local_journeys == []
+
+
+@patch("services.fetch_flight_events", new_callable=AsyncMock)
+def test_api_day_parameter(mock_fetch_flight_events):
+    mock_fetch_flight_events.return_value = FLIGHTS
+    client = TestClient(app)
+    params = {"date": "2024-09-13", "from": "BUE", "to": "MAD"}
+
+    assert len(client.get("/journeys/search", params=params).json()) == 1
+    assert (
+        "message"
+        in client.get("/journeys/search", params={**params, "day": "local"}).json()
+    )
+    assert (
+        client.get("/journeys/search", params={**params, "day": "UTC"}).status_code
+        == 422
+    )
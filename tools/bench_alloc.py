@@ -0,0 +1,110 @@
+"""
+Allocation benchmark for the search phase on hub-heavy queries.
+
+Builds a synthetic snapshot, then uses tracemalloc to compare two pipelines end
+to end (search plus JSON serialization): the service's lightweight
+`JourneyCandidate`s serialized directly, and a baseline that builds a validated
+`Journey` model for every result as the search finds it:
+
+    python -m tools.bench_alloc --size 10000
+"""
+
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Callable, List, Tuple
+from unittest.mock import patch
+
+from pydantic import TypeAdapter
+
+from main import journey_payloads_adapter
+from models import FlightEvent, Journey
+from services import (
+    build_flights_index_by_departure,
+    get_connecting_flights,
+    get_direct_flights,
+)
+from snapshot import FlightSnapshot
+from tools.feed_server import HUB_CITIES, generate_flight_events
+
+# Hub-to-hub routes have the widest fan-out in the synthetic network.
+HUB_ROUTES = [
+    (origin, destination)
+    for origin in HUB_CITIES
+    for destination in HUB_CITIES
+    if origin != destination
+]
+
+TIMING_RUNS = 3
+
+
+def measure(label: str, step: Callable[[], object]) -> object:
+    """
+    Runs `step` under tracemalloc for its peak allocation, then again untraced for
+    timing (best of TIMING_RUNS), so tracing overhead and first-run warm-up do not
+    skew the time.
+    """
+    tracemalloc.start()
+    result = step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elapsed = float("inf")
+    for _ in range(TIMING_RUNS):
+        started = perf_counter()
+        step()
+        elapsed = min(elapsed, perf_counter() - started)
+    print(f"{label:<30} peak {peak / 1024:>10.1f} KiB  {elapsed * 1000:>8.1f} ms")
+    return result
+
+
+journeys_adapter = TypeAdapter(List[Journey])
+
+
+def eager_journey(*path: FlightEvent) -> Journey:
+    """Baseline: a validated `Journey` for every result, built during the search."""
+    return Journey(connections=len(path) - 1, path=list(path))
+
+
+def search_candidates(flights: List[FlightEvent], routes: List[Tuple[str, str]]):
+    """Runs the search phase for every route over the same date partition."""
+    index = build_flights_index_by_departure(flights)
+    candidates = []
+    for origin, destination in routes:
+        candidates += get_direct_flights(index.get(origin, []), destination)
+        candidates += get_connecting_flights(index, origin, destination)
+    return candidates
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10000, help="Synthetic events")
+    parser.add_argument("--days", type=int, default=7, help="Days covered by events")
+    args = parser.parse_args()
+
+    start_date = datetime.now(timezone.utc).date()
+    events = [
+        FlightEvent(**event)
+        for event in generate_flight_events(args.size, start_date, args.days)
+    ]
+    flights = FlightSnapshot(events).flights_for_date(start_date + timedelta(days=1))
+    print(f"{len(flights)} flights on the searched days, {len(HUB_ROUTES)} hub routes")
+
+    def candidates_pipeline():
+        candidates = search_candidates(flights, HUB_ROUTES)
+        return journey_payloads_adapter.dump_json([c.to_payload() for c in candidates])
+
+    def eager_pipeline():
+        with patch("services.JourneyCandidate", eager_journey):
+            journeys = search_candidates(flights, HUB_ROUTES)
+        return journeys_adapter.dump_json(journeys)
+
+    candidates_json = measure("candidates (search + json)", candidates_pipeline)
+    eager_json = measure("eager Journey (search + json)", eager_pipeline)
+    assert candidates_json == eager_json, "pipelines must produce the same response"
+    print(f"{len(candidates_json) / 1024:.1f} KiB of JSON from each pipeline")
+
+
+if __name__ == "__main__":
+    main()
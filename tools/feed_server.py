@@ -0,0 +1,144 @@
+"""
+Local stand-in for the upstream flight-events feed.
+
+Serves synthetic or recorded flight-event payloads with injectable latency,
+errors and payload size, so the service can be exercised without the network:
+
+    FEED_SIZE=5000 FEED_LATENCY_MS=80 uvicorn tools.feed_server:app --port 9000
+    FLIGHT_EVENTS_API_URL=http://127.0.0.1:9000/flight-events uvicorn main:app
+"""
+
+import json
+from asyncio import sleep
+from datetime import date, datetime, time, timedelta, timezone
+from os import getenv
+from random import Random
+from typing import List, Optional
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+# Hubs are listed first and weighted heavier so fan-out looks like a real network.
+HUB_CITIES = ["MAD", "JFK", "MIA", "LON", "PAR"]
+SPOKE_CITIES = ["BUE", "PMI", "BCN", "LIS", "ROM", "SCL", "LIM", "BOG", "MEX", "GRU"]
+
+
+class FeedSettings(BaseModel):
+    size: int = Field(500, ge=0, description="Number of synthetic events served")
+    days: int = Field(7, ge=1, description="Days covered by synthetic events")
+    seed: int = Field(42, description="Seed for the synthetic generator")
+    start_date: Optional[date] = Field(
+        None, description="First day of synthetic events (defaults to today, UTC)"
+    )
+    source: Optional[str] = Field(
+        None, description="Path to a recorded JSON payload served instead"
+    )
+    latency_ms: float = Field(0.0, ge=0, description="Added latency per response")
+    jitter_ms: float = Field(0.0, ge=0, description="Random extra latency (uniform)")
+    error_rate: float = Field(
+        0.0, ge=0, le=1, description="Fraction of responses that fail"
+    )
+    error_status: int = Field(500, description="Status code of failed responses")
+
+    @classmethod
+    def from_env(cls) -> "FeedSettings":
+        """Builds settings from `FEED_*` environment variables."""
+        values = {
+            name: getenv(f"FEED_{name.upper()}")
+            for name in cls.model_fields
+            if getenv(f"FEED_{name.upper()}") is not None
+        }
+        return cls(**values)
+
+
+def generate_flight_events(
+    size: int, start_date: date, days: int = 7, seed: int = 42
+) -> List[dict]:
+    """
+    Generates a deterministic list of flight-event payloads shaped like the upstream API.
+    """
+    rng = Random(seed)
+    cities = HUB_CITIES + SPOKE_CITIES
+    weights = [5] * len(HUB_CITIES) + [1] * len(SPOKE_CITIES)
+    start = datetime.combine(start_date, time.min, tzinfo=timezone.utc)
+
+    events = []
+    for number in range(size):
+        departure_city, arrival_city = rng.sample(cities, 2, counts=weights)
+        while departure_city == arrival_city:
+            arrival_city = rng.choices(cities, weights)[0]
+        departure = start + timedelta(minutes=rng.randrange(days * 24 * 60))
+        arrival = departure + timedelta(minutes=rng.randrange(45, 14 * 60))
+        events.append(
+            {
+                "flight_number": f"XX{number:04d}",
+                "departure_city": departure_city,
+                "arrival_city": arrival_city,
+                "departure_datetime": departure.isoformat().replace("+00:00", "Z"),
+                "arrival_datetime": arrival.isoformat().replace("+00:00", "Z"),
+            }
+        )
+    return events
+
+
+def load_recorded_events(path: str) -> List[dict]:
+    """
+    Loads a recorded upstream payload (a JSON array of flight events).
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def create_app(settings: FeedSettings) -> FastAPI:
+    """
+    Builds the stand-in feed app. Payloads are built once; every query parameter
+    overrides the matching setting for a single response.
+
+    A synthetic feed is regenerated (with the same seed, so earlier events are
+    unchanged) when `size` asks for more events than it holds. A recorded payload
+    cannot grow, so `size` only truncates it.
+    """
+    feed_app = FastAPI(title="Flight events stand-in feed")
+    rng = Random(settings.seed)
+    start_date = settings.start_date or datetime.now(timezone.utc).date()
+
+    if settings.source:
+        events = load_recorded_events(settings.source)
+    else:
+        events = generate_flight_events(
+            settings.size, start_date, settings.days, settings.seed
+        )
+
+    @feed_app.get("/flight-events")
+    async def flight_events(
+        size: Optional[int] = Query(None, ge=0),
+        latency_ms: Optional[float] = Query(None, ge=0),
+        error_rate: Optional[float] = Query(None, ge=0, le=1),
+    ):
+        nonlocal events
+        delay = settings.latency_ms if latency_ms is None else latency_ms
+        if settings.jitter_ms:
+            delay += rng.uniform(0, settings.jitter_ms)
+        if delay:
+            await sleep(delay / 1000)
+
+        failure_rate = settings.error_rate if error_rate is None else error_rate
+        if failure_rate and rng.random() < failure_rate:
+            return JSONResponse(
+                status_code=settings.error_status,
+                content={"message": "Injected upstream failure"},
+            )
+
+        if size is None:
+            return events
+        if size > len(events) and not settings.source:
+            events = generate_flight_events(
+                size, start_date, settings.days, settings.seed
+            )
+        return events[:size]
+
+    return feed_app
+
+
+app = create_app(FeedSettings.from_env())
@@ -0,0 +1,167 @@
+"""
+Replays recorded search traffic against the service at a target QPS and reports
+latency percentiles.
+
+Each line of the log is a JSON object with `from`, `to` and either an absolute
+`date` (YYYY-MM-DD) or `days_ahead`, relative to today (UTC):
+
+    {"date": "2024-09-12", "from": "BUE", "to": "MAD"}
+    {"days_ahead": 2, "from": "BUE", "to": "PMI"}
+
+Run against a live service, or in-process against `main.app`:
+
+    python -m tools.replay tools/sample_traffic.jsonl --qps 50 --base-url http://127.0.0.1:8000
+    python -m tools.replay tools/sample_traffic.jsonl --qps 50 --in-process
+"""
+
+import json
+from argparse import ArgumentParser, ArgumentTypeError
+from asyncio import gather, run, sleep
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from math import ceil
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from httpx import AsyncBaseTransport, AsyncClient, ASGITransport, RequestError
+from pydantic import BaseModel, Field
+
+SEARCH_PATH = "/journeys/search"
+REPORTED_PERCENTILES = (50, 90, 95, 99)
+
+
+class ReplayReport(BaseModel):
+    requests: int = Field(..., description="Number of requests sent")
+    elapsed_s: float = Field(..., description="Wall-clock duration of the replay")
+    achieved_qps: float = Field(..., description="Requests completed per second")
+    status_counts: Dict[str, int] = Field(
+        ..., description="Responses per status code ('error' for transport errors)"
+    )
+    latency_ms: Dict[str, float] = Field(
+        ..., description="Latency percentiles, mean and max in milliseconds"
+    )
+
+
+def load_queries(path: str) -> List[Dict[str, str]]:
+    """
+    Loads search queries from a JSONL traffic log, resolving `days_ahead` to a date.
+    """
+    today = datetime.now(timezone.utc).date()
+    queries = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            date = entry.get("date")
+            if date is None:
+                date = (today + timedelta(days=entry["days_ahead"])).isoformat()
+            queries.append({"date": date, "from": entry["from"], "to": entry["to"]})
+    return queries
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of `values` (0.0 for an empty list).
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def replay(
+    queries: List[Dict[str, str]],
+    base_url: str,
+    qps: float,
+    transport: Optional[AsyncBaseTransport] = None,
+) -> ReplayReport:
+    """
+    Sends `queries` open-loop at `qps`: request i is issued at i / qps seconds,
+    regardless of how long earlier requests take.
+    """
+    if not qps > 0:
+        raise ValueError(f"qps must be positive, got {qps}.")
+    latencies = []
+    statuses = Counter()
+
+    async with AsyncClient(base_url=base_url, transport=transport) as client:
+
+        async def send(offset: float, params: Dict[str, str]):
+            await sleep(max(offset - (perf_counter() - started), 0))
+            sent = perf_counter()
+            try:
+                response = await client.get(SEARCH_PATH, params=params)
+                statuses[str(response.status_code)] += 1
+            except RequestError:
+                statuses["error"] += 1
+            latencies.append((perf_counter() - sent) * 1000)
+
+        started = perf_counter()
+        await gather(*(send(i / qps, query) for i, query in enumerate(queries)))
+        elapsed = perf_counter() - started
+
+    latency_ms = {f"p{pct}": percentile(latencies, pct) for pct in REPORTED_PERCENTILES}
+    latency_ms["mean"] = sum(latencies) / len(latencies) if latencies else 0.0
+    latency_ms["max"] = max(latencies, default=0.0)
+
+    return ReplayReport(
+        requests=len(queries),
+        elapsed_s=elapsed,
+        achieved_qps=len(queries) / elapsed if elapsed else 0.0,
+        status_counts=dict(statuses),
+        latency_ms=latency_ms,
+    )
+
+
+def positive_float(value: str) -> float:
+    """Argument type for strictly positive floats."""
+    number = float(value)
+    if not number > 0:
+        raise ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    """Argument type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("log", help="JSONL traffic log to replay")
+    parser.add_argument(
+        "--qps", type=positive_float, default=10.0, help="Target request rate"
+    )
+    parser.add_argument(
+        "--base-url", default="http://127.0.0.1:8000", help="Service under test"
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Drive main.app directly through ASGI instead of over HTTP",
+    )
+    parser.add_argument(
+        "--repeat", type=positive_int, default=1, help="Replay the log this many times"
+    )
+    args = parser.parse_args()
+
+    transport = None
+    base_url = args.base_url
+    if args.in_process:
+        from main import app
+
+        transport = ASGITransport(app=app)
+        base_url = "http://service"
+
+    queries = load_queries(args.log) * args.repeat
+    report = run(replay(queries, base_url, args.qps, transport))
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()